@@ -16,10 +16,48 @@ get_appointments(filters: { date?: string, status?: string, doctorName?: string
 create_appointment(input: CreateAppointmentInput) -> Appointment
 update_appointment_status(id: string, new_status: string) -> Appointment
 delete_appointment(id: string) -> boolean
+
+Implementation note:
+--------------------
+The hot paths (filter predicates, conflict scan, index maintenance) are
+deliberately plain Python - small-object iteration, simple comparisons and
+direct closures, with no NumPy or C-extension callables in the loops. That
+keeps the module fully portable to PyPy, where the tracing JIT can inline
+and specialize these loops for a sizable speedup with no code changes.
+
+Scaling note:
+-------------
+Every query here is already index-backed (id-set intersection for
+filters, a sorted (doctorName, date) bucket for the conflict scan, a
+sorted (date, id) list for period slicing, maintained counters for the
+stats), so per-request work stays O(log n + matches) regardless of table
+size. If the working set ever outgrows a single process, the next step
+is not more Python machinery but a real engine: the same schema and
+indexes port directly to in-memory SQLite (one parameterized SELECT per
+query) or to the Aurora PostgreSQL deployment this module simulates.
+The mutation functions are the only write paths, so a storage swap is
+contained behind this module's public API.
 """
 
-from datetime import datetime
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 import json
+import re
+import sys
+import threading
+import time
+
+# orjson serializes dict/list payloads several times faster than the stdlib
+# encoder and produces bytes directly; fall back to json so the module stays
+# runnable without the optional dependency.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # MOCK DATA - Simulating Aurora PostgreSQL Database
@@ -30,178 +68,466 @@ import json
 # Auto-increment counter for generating unique IDs
 _next_id = 13
 
+
+def _time_to_minutes(time_str):
+    """Convert strict "HH:MM" to total minutes.
+
+    Slicing on the fixed colon position skips the split/map machinery
+    (no list, no iterator, no tuple unpack) for this hot parse.
+    """
+    return int(time_str[:2]) * 60 + int(time_str[3:])
+
+
+# Factorization table: statuses draw from a tiny vocabulary, so each
+# distinct string is assigned a small int once and the cancelled check in
+# the conflict scan compares ints instead of going through string
+# rich-comparison. Date and doctor filtering is carried entirely by the
+# id-set indexes, so those fields need no codes.
+_status_codes = {}
+
+
+def _code(value, table):
+    """Return the stable small-int code for value, assigning one if new."""
+    return table.setdefault(value, len(table))
+
+
+_CANCELLED_CODE = _code("Cancelled", _status_codes)
+
+
+@dataclass(slots=True)
+class Appointment:
+    """
+    In-memory appointment record, simulating one row of the Aurora
+    appointments table.
+
+    slots=True stores the fields in fixed slots instead of a per-instance
+    dict, which roughly halves per-record memory and makes field access a
+    direct slot read rather than a hash lookup - both matter in the filter
+    and conflict-check loops that touch every record.
+    """
+    id: int
+    name: str
+    date: str
+    time: str
+    duration: int
+    doctorName: str
+    status: str
+    mode: str
+    reason: str = ""
+    phone: str = ""
+    email: str = ""
+    notes: str = ""
+    # Cached time window in minutes, derived from time/duration so the
+    # conflict check never re-parses the HH:MM string.
+    start_minutes: int = field(init=False)
+    end_minutes: int = field(init=False)
+    # Factorized status code for the compare-heavy cancelled check
+    # (see _code above)
+    status_code: int = field(init=False)
+
+    def __post_init__(self):
+        # date/status/mode/doctorName draw from tiny fixed vocabularies;
+        # interning them lets the == in the filter and conflict loops
+        # short-circuit on pointer identity instead of comparing characters.
+        self.date = sys.intern(self.date)
+        self.doctorName = sys.intern(self.doctorName)
+        self.status = sys.intern(self.status)
+        self.mode = sys.intern(self.mode)
+        self.start_minutes = _time_to_minutes(self.time)
+        self.end_minutes = self.start_minutes + self.duration
+        self.status_code = _code(self.status, _status_codes)
+
+    def to_dict(self):
+        """Return the public (JSON/GraphQL contract) view of the record."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "date": self.date,
+            "time": self.time,
+            "duration": self.duration,
+            "doctorName": self.doctorName,
+            "status": self.status,
+            "mode": self.mode,
+            "reason": self.reason,
+            "phone": self.phone,
+            "email": self.email,
+            "notes": self.notes,
+        }
+
+
 appointments_data = [
-    {
-        "id": 1,
-        "name": "Sarah Johnson",
-        "date": "2026-01-30",
-        "time": "09:00",
-        "duration": 30,
-        "doctorName": "Dr. Rajesh Kumar",
-        "status": "Confirmed",
-        "mode": "In-Person",
-        "reason": "Diabetes Management",
-        "phone": "+91 98765 43210",
-        "email": "sarah.j@email.com",
-        "notes": "Patient needs prescription refill"
-    },
-    {
-        "id": 2,
-        "name": "Michael Chen",
-        "date": "2026-01-30",
-        "time": "10:00",
-        "duration": 45,
-        "doctorName": "Dr. Priya Sharma",
-        "status": "Scheduled",
-        "mode": "In-Person",
-        "reason": "Annual Physical Examination",
-        "phone": "+91 98765 43211",
-        "email": "m.chen@email.com",
-        "notes": ""
-    },
-    {
-        "id": 3,
-        "name": "Emily Rodriguez",
-        "date": "2026-01-30",
-        "time": "11:30",
-        "duration": 30,
-        "doctorName": "Dr. Rajesh Kumar",
-        "status": "Confirmed",
-        "mode": "Video Call",
-        "reason": "Cold and Flu Symptoms",
-        "phone": "+91 98765 43212",
-        "email": "emily.r@email.com",
-        "notes": "Video consultation requested"
-    },
-    {
-        "id": 4,
-        "name": "Rahul Sharma",
-        "date": "2026-01-31",
-        "time": "09:00",
-        "duration": 30,
-        "doctorName": "Dr. Priya Sharma",
-        "status": "Upcoming",
-        "mode": "In-Person",
-        "reason": "General Checkup",
-        "phone": "+91 98765 43213",
-        "email": "rahul.s@email.com",
-        "notes": ""
-    },
-    {
-        "id": 5,
-        "name": "Anita Desai",
-        "date": "2026-01-31",
-        "time": "14:00",
-        "duration": 45,
-        "doctorName": "Dr. Amit Patel",
-        "status": "Upcoming",
-        "mode": "Video Call",
-        "reason": "Follow-up Consultation",
-        "phone": "+91 98765 43214",
-        "email": "anita.d@email.com",
-        "notes": ""
-    },
-    {
-        "id": 6,
-        "name": "Vikram Singh",
-        "date": "2026-01-29",
-        "time": "10:00",
-        "duration": 30,
-        "doctorName": "Dr. Rajesh Kumar",
-        "status": "Confirmed",
-        "mode": "In-Person",
-        "reason": "Blood Pressure Check",
-        "phone": "+91 98765 43215",
-        "email": "vikram.s@email.com",
-        "notes": "Regular checkup"
-    },
-    {
-        "id": 7,
-        "name": "Priya Nair",
-        "date": "2026-01-29",
-        "time": "15:30",
-        "duration": 45,
-        "doctorName": "Dr. Amit Patel",
-        "status": "Cancelled",
-        "mode": "In-Person",
-        "reason": "Skin Consultation",
-        "phone": "+91 98765 43216",
-        "email": "priya.n@email.com",
-        "notes": "Patient cancelled"
-    },
-    {
-        "id": 8,
-        "name": "Deepak Malhotra",
-        "date": "2026-02-01",
-        "time": "09:30",
-        "duration": 30,
-        "doctorName": "Dr. Priya Sharma",
-        "status": "Scheduled",
-        "mode": "In-Person",
-        "reason": "Vaccination",
-        "phone": "+91 98765 43217",
-        "email": "deepak.m@email.com",
-        "notes": ""
-    },
-    {
-        "id": 9,
-        "name": "Sunita Verma",
-        "date": "2026-02-01",
-        "time": "11:00",
-        "duration": 60,
-        "doctorName": "Dr. Rajesh Kumar",
-        "status": "Upcoming",
-        "mode": "In-Person",
-        "reason": "Complete Health Checkup",
-        "phone": "+91 98765 43218",
-        "email": "sunita.v@email.com",
-        "notes": ""
-    },
-    {
-        "id": 10,
-        "name": "Kiran Joshi",
-        "date": "2026-01-30",
-        "time": "16:00",
-        "duration": 30,
-        "doctorName": "Dr. Amit Patel",
-        "status": "Confirmed",
-        "mode": "Phone Call",
-        "reason": "Test Results Discussion",
-        "phone": "+91 98765 43219",
-        "email": "kiran.j@email.com",
-        "notes": ""
-    },
-    {
-        "id": 11,
-        "name": "Neha Kapoor",
-        "date": "2026-01-28",
-        "time": "10:30",
-        "duration": 30,
-        "doctorName": "Dr. Amit Patel",
-        "status": "Confirmed",
-        "mode": "Phone Call",
-        "reason": "Medication Review",
-        "phone": "+91 98765 43220",
-        "email": "neha.k@email.com",
-        "notes": "Past appointment - completed"
-    },
-    {
-        "id": 12,
-        "name": "Amit Tiwari",
-        "date": "2026-02-02",
-        "time": "14:30",
-        "duration": 45,
-        "doctorName": "Dr. Priya Sharma",
-        "status": "Scheduled",
-        "mode": "Video Call",
-        "reason": "Mental Health Consultation",
-        "phone": "+91 98765 43221",
-        "email": "amit.t@email.com",
-        "notes": "First time patient"
-    }
+    Appointment(
+        id=1,
+        name="Sarah Johnson",
+        date="2026-01-30",
+        time="09:00",
+        duration=30,
+        doctorName="Dr. Rajesh Kumar",
+        status="Confirmed",
+        mode="In-Person",
+        reason="Diabetes Management",
+        phone="+91 98765 43210",
+        email="sarah.j@email.com",
+        notes="Patient needs prescription refill",
+    ),
+    Appointment(
+        id=2,
+        name="Michael Chen",
+        date="2026-01-30",
+        time="10:00",
+        duration=45,
+        doctorName="Dr. Priya Sharma",
+        status="Scheduled",
+        mode="In-Person",
+        reason="Annual Physical Examination",
+        phone="+91 98765 43211",
+        email="m.chen@email.com",
+        notes="",
+    ),
+    Appointment(
+        id=3,
+        name="Emily Rodriguez",
+        date="2026-01-30",
+        time="11:30",
+        duration=30,
+        doctorName="Dr. Rajesh Kumar",
+        status="Confirmed",
+        mode="Video Call",
+        reason="Cold and Flu Symptoms",
+        phone="+91 98765 43212",
+        email="emily.r@email.com",
+        notes="Video consultation requested",
+    ),
+    Appointment(
+        id=4,
+        name="Rahul Sharma",
+        date="2026-01-31",
+        time="09:00",
+        duration=30,
+        doctorName="Dr. Priya Sharma",
+        status="Upcoming",
+        mode="In-Person",
+        reason="General Checkup",
+        phone="+91 98765 43213",
+        email="rahul.s@email.com",
+        notes="",
+    ),
+    Appointment(
+        id=5,
+        name="Anita Desai",
+        date="2026-01-31",
+        time="14:00",
+        duration=45,
+        doctorName="Dr. Amit Patel",
+        status="Upcoming",
+        mode="Video Call",
+        reason="Follow-up Consultation",
+        phone="+91 98765 43214",
+        email="anita.d@email.com",
+        notes="",
+    ),
+    Appointment(
+        id=6,
+        name="Vikram Singh",
+        date="2026-01-29",
+        time="10:00",
+        duration=30,
+        doctorName="Dr. Rajesh Kumar",
+        status="Confirmed",
+        mode="In-Person",
+        reason="Blood Pressure Check",
+        phone="+91 98765 43215",
+        email="vikram.s@email.com",
+        notes="Regular checkup",
+    ),
+    Appointment(
+        id=7,
+        name="Priya Nair",
+        date="2026-01-29",
+        time="15:30",
+        duration=45,
+        doctorName="Dr. Amit Patel",
+        status="Cancelled",
+        mode="In-Person",
+        reason="Skin Consultation",
+        phone="+91 98765 43216",
+        email="priya.n@email.com",
+        notes="Patient cancelled",
+    ),
+    Appointment(
+        id=8,
+        name="Deepak Malhotra",
+        date="2026-02-01",
+        time="09:30",
+        duration=30,
+        doctorName="Dr. Priya Sharma",
+        status="Scheduled",
+        mode="In-Person",
+        reason="Vaccination",
+        phone="+91 98765 43217",
+        email="deepak.m@email.com",
+        notes="",
+    ),
+    Appointment(
+        id=9,
+        name="Sunita Verma",
+        date="2026-02-01",
+        time="11:00",
+        duration=60,
+        doctorName="Dr. Rajesh Kumar",
+        status="Upcoming",
+        mode="In-Person",
+        reason="Complete Health Checkup",
+        phone="+91 98765 43218",
+        email="sunita.v@email.com",
+        notes="",
+    ),
+    Appointment(
+        id=10,
+        name="Kiran Joshi",
+        date="2026-01-30",
+        time="16:00",
+        duration=30,
+        doctorName="Dr. Amit Patel",
+        status="Confirmed",
+        mode="Phone Call",
+        reason="Test Results Discussion",
+        phone="+91 98765 43219",
+        email="kiran.j@email.com",
+        notes="",
+    ),
+    Appointment(
+        id=11,
+        name="Neha Kapoor",
+        date="2026-01-28",
+        time="10:30",
+        duration=30,
+        doctorName="Dr. Amit Patel",
+        status="Confirmed",
+        mode="Phone Call",
+        reason="Medication Review",
+        phone="+91 98765 43220",
+        email="neha.k@email.com",
+        notes="Past appointment - completed",
+    ),
+    Appointment(
+        id=12,
+        name="Amit Tiwari",
+        date="2026-02-02",
+        time="14:30",
+        duration=45,
+        doctorName="Dr. Priya Sharma",
+        status="Scheduled",
+        mode="Video Call",
+        reason="Mental Health Consultation",
+        phone="+91 98765 43221",
+        email="amit.t@email.com",
+        notes="First time patient",
+    ),
 ]
 
 
+# =============================================================================
+# SECONDARY INDEX - Simulating a composite database index
+# =============================================================================
+# In production, conflict detection would be backed by a composite index:
+# CREATE INDEX idx_doctor_date ON appointments (doctor_name, date);
+# Here we simulate it with a dict keyed by (doctorName, date) so the overlap
+# check in create_appointment only scans that doctor's appointments for that
+# day instead of the whole table. Each bucket entry is a
+# (start_minutes, end_minutes, id, appointment) tuple so the overlap check
+# compares plain integers instead of re-parsing "HH:MM" strings and doing
+# dict lookups per field. Buckets are kept sorted by start time, and
+# _bucket_max_duration tracks the longest appointment seen per bucket so a
+# binary search can jump straight to the first possible overlap candidate.
+#
+# appointments_data itself is keyed by id (the primary key), so the mutation
+# functions resolve an id with one hash lookup, and deletion is a dict pop
+# instead of an O(n) list removal that shifts every following element.
+# Python dicts preserve insertion order, so iterating .values() still walks
+# the table in creation order like the old list did.
+#
+# _by_date / _by_status / _by_doctor are single-column indexes
+# (value -> set of appointment ids). get_appointments intersects the sets
+# for the provided filters - set intersection iterates the smallest operand
+# internally - and maps the surviving ids through the primary store, so a
+# filtered query never scans rows that fail any provided filter.
+
+_by_doctor_date = defaultdict(list)
+_bucket_max_duration = defaultdict(int)
+_by_date = defaultdict(set)
+_by_status = defaultdict(set)
+_by_doctor = defaultdict(set)
+
+# Sorted list of (date, id) pairs - effectively the leaf level of a B-tree
+# index on the date column. Period queries (past/today/upcoming) bisect to
+# the split points around today and slice, touching only the rows they
+# return instead of comparing every appointment's date string. Writers
+# publish a rebuilt copy rather than editing in place (insort already
+# shifts O(n) elements, so the copy costs nothing extra) - a lock-free
+# reader bisecting a captured reference can never hit a list that shrinks
+# under its probes.
+_dates_sorted = []
+
+# Incrementally maintained aggregates for the dashboard stats: distinct
+# patients/doctors and per-(date), (date, status), (date, mode) counts.
+# Every mutation adjusts these counters, so get_stats() is a handful of
+# dict reads instead of several full scans per request.
+_patient_counts = Counter()
+_doctor_counts = Counter()
+_count_by_date = Counter()
+_count_by_date_status = Counter()
+_count_by_date_mode = Counter()
+
+# Sorted list of distinct doctor names, rebuilt only when a doctor first
+# appears or last disappears (a 0<->1 transition in _doctor_counts). The
+# set of doctors is bounded to a few dozen, so the occasional rebuild is
+# cheap, and every read is a plain reference.
+_sorted_doctors = []
+
+
+def _rebuild_sorted_doctors():
+    # Rebind rather than sort in place so a reader holding the old list
+    # never sees a half-sorted state.
+    global _sorted_doctors
+    _sorted_doctors = sorted(_doctor_counts)
+
+
+def _dec(counter, key):
+    """Decrement a counter key, dropping it at zero so len() stays exact."""
+    n = counter[key] - 1
+    if n:
+        counter[key] = n
+    else:
+        del counter[key]
+
+
+def _index_appointment(apt):
+    """Insert an appointment into every secondary index."""
+    global _dates_sorted
+    key = (apt.doctorName, apt.date)
+    insort(_by_doctor_date[key], (apt.start_minutes, apt.end_minutes, apt.id, apt))
+    if apt.duration > _bucket_max_duration[key]:
+        _bucket_max_duration[key] = apt.duration
+    # Copy-on-write: rebind a fresh set per touched key instead of
+    # mutating the published one, so lock-free readers holding the old
+    # set never see it change under them (see the CONCURRENCY section).
+    _by_date[apt.date] = _by_date[apt.date] | {apt.id}
+    _by_status[apt.status] = _by_status[apt.status] | {apt.id}
+    _by_doctor[apt.doctorName] = _by_doctor[apt.doctorName] | {apt.id}
+    dates = _dates_sorted.copy()
+    insort(dates, (apt.date, apt.id))
+    _dates_sorted = dates
+    _patient_counts[apt.name] += 1
+    _doctor_counts[apt.doctorName] += 1
+    if _doctor_counts[apt.doctorName] == 1:
+        _rebuild_sorted_doctors()
+    _count_by_date[apt.date] += 1
+    _count_by_date_status[(apt.date, apt.status)] += 1
+    _count_by_date_mode[(apt.date, apt.mode)] += 1
+
+
+def _unindex_appointment(apt):
+    """Remove an appointment from every secondary index."""
+    global _dates_sorted
+    # _bucket_max_duration is left as-is: it only needs to be an upper
+    # bound for the bucket, so it never shrinks.
+    entry = (apt.start_minutes, apt.end_minutes, apt.id, apt)
+    bucket = _by_doctor_date[(apt.doctorName, apt.date)]
+    # The bucket is kept sorted, so locate the entry with a binary search
+    # instead of list.remove()'s linear scan.
+    del bucket[bisect_left(bucket, entry[:3])]
+    _by_date[apt.date] = _by_date[apt.date] - {apt.id}
+    _by_status[apt.status] = _by_status[apt.status] - {apt.id}
+    _by_doctor[apt.doctorName] = _by_doctor[apt.doctorName] - {apt.id}
+    dates = _dates_sorted.copy()
+    del dates[bisect_left(dates, (apt.date, apt.id))]
+    _dates_sorted = dates
+    _dec(_patient_counts, apt.name)
+    _dec(_doctor_counts, apt.doctorName)
+    if apt.doctorName not in _doctor_counts:
+        _rebuild_sorted_doctors()
+    _dec(_count_by_date, apt.date)
+    _dec(_count_by_date_status, (apt.date, apt.status))
+    _dec(_count_by_date_mode, (apt.date, apt.mode))
+
+
+# Re-key the seed list by id: appointments_data is the primary store,
+# equivalent to the table with its primary-key index.
+appointments_data = {apt.id: apt for apt in appointments_data}
+
+for _apt in appointments_data.values():
+    _index_appointment(_apt)
+del _apt
+
+
+# =============================================================================
+# CONCURRENCY - copy-on-write snapshot for readers, one lock for writers
+# =============================================================================
+# Full-table readers grab _snapshot, an immutable tuple republished by the
+# writers, so they never observe a half-applied mutation and need no lock.
+# Writers (create/update/delete) serialize on _write_lock while they touch
+# the table and the secondary indexes. Appointment APIs are read-heavy, so
+# paying the snapshot rebuild on the rare write keeps the common path free
+# of contention.
+#
+# The id-set indexes follow the same copy-on-write discipline: writers
+# never call add()/remove() on a published set - they build a new set and
+# rebind the dict slot in one assignment, which CPython performs
+# atomically. A reader that captured the old set keeps a fully consistent
+# (if momentarily stale) value; there is no observable mid-mutation state.
+# _dates_sorted is republished as a fresh list the same way, and the stats
+# counters are only ever read through single .get()/len() calls, which are
+# indivisible under the GIL.
+# Readers therefore take no lock anywhere; the one residual race - an id
+# observed in an index a beat before/after the row lands in or leaves the
+# primary store - is absorbed by looking rows up with .get() and skipping
+# misses.
+
+_write_lock = threading.Lock()
+_snapshot = tuple(appointments_data.values())
+
+# Monotonic data version, bumped by every successful mutation. Cached query
+# results are keyed on it, so invalidation is free: a write produces a new
+# version, repeat queries against the new version miss the cache once, and
+# entries for old versions simply age out of the LRU.
+_version = 0
+
+
+def _publish_snapshot():
+    """Republish the immutable reader view after a membership change."""
+    global _snapshot
+    _snapshot = tuple(appointments_data.values())
+
+
+def _bump_version():
+    """Advance the data version so stale cached query results are bypassed."""
+    global _version
+    _version += 1
+
+
+# Required fields for create_appointment. The tuple preserves declaration
+# order for error messages; the frozenset gives a one-shot C-level set
+# difference against payload.keys() on the validation fast path.
+_REQUIRED_FIELD_ORDER = ('patientName', 'date', 'time', 'duration', 'doctorName', 'mode')
+_REQUIRED_FIELDS = frozenset(_REQUIRED_FIELD_ORDER)
+
+# C-level multi-field extractor for the conflict-check inputs; the key
+# hashes are computed once here instead of per payload lookup.
+_CONFLICT_FIELDS = itemgetter('date', 'time', 'duration', 'doctorName')
+
+# Allowed values for the enum-like columns, as frozensets for O(1)
+# membership tests, and format patterns compiled once at import time so
+# validation never rebuilds a regex per call. Malformed dates/times
+# would silently corrupt the sorted indexes (string order is only
+# chronological for well-formed YYYY-MM-DD / HH:MM), so these checks
+# also protect index integrity.
+_VALID_STATUSES = frozenset({'Confirmed', 'Scheduled', 'Upcoming', 'Cancelled'})
+_VALID_MODES = frozenset({'In-Person', 'Video Call', 'Phone Call'})
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_TIME_RE = re.compile(r'^\d{2}:\d{2}$')
+
+
 # =============================================================================
 # QUERY FUNCTION: get_appointments(filters)
 # =============================================================================
@@ -245,24 +571,55 @@ def get_appointments(date=None, status=None, doctorName=None):
         doctorName (str, optional): Filter by doctor name
 
     Returns:
-        list: List of appointment dictionaries matching the filters
+        Sequence: Appointment records matching the filters, in insertion
+        order. The no-filter case returns a shared immutable snapshot;
+        treat the result as read-only and call list() if you need to
+        mutate it.
     """
-    # Start with all appointments (simulating database fetch)
-    result = appointments_data.copy()
-    
-    # Apply date filter if provided
+    # No filters: hand back the immutable snapshot itself (simulating
+    # SELECT *) - zero allocation, no lock, no index machinery. The
+    # snapshot is a tuple, so callers can't accidentally corrupt the
+    # shared table view, and mutations replace it rather than mutate it.
+    if not date and not status and not doctorName:
+        return _snapshot
+
+    # Repeat queries are served from the version-keyed cache (see
+    # _cached_query); a fresh list is returned so callers can't corrupt
+    # the cached tuple.
+    return list(_cached_query(_version, date, status, doctorName))
+
+
+@lru_cache(maxsize=128)
+def _cached_query(version, date, status, doctorName):
+    """Execute a filtered query; results are memoized per data version.
+
+    `version` only participates in the cache key: once a mutation bumps it,
+    lookups for the new version miss, the query re-runs against the current
+    indexes, and entries for old versions age out of the LRU.
+    """
+    # Collect the id-set for each provided filter (simulating the query
+    # planner intersecting index scans). A filter value the table has never
+    # seen means an empty result with no further work.
+    id_sets = []
     if date:
-        result = [apt for apt in result if apt["date"] == date]
-    
-    # Apply status filter if provided
+        id_sets.append(_by_date.get(date))
     if status:
-        result = [apt for apt in result if apt["status"] == status]
-    
-    # Apply doctor filter if provided
+        id_sets.append(_by_status.get(status))
     if doctorName:
-        result = [apt for apt in result if apt["doctorName"] == doctorName]
-
-    return result
+        id_sets.append(_by_doctor.get(doctorName))
+    if None in id_sets:
+        return ()
+
+    # One C-level intersection (it iterates the smallest operand itself),
+    # then map ids through the primary store. Sorting the ids keeps the
+    # result in insertion order, since ids are assigned monotonically.
+    # .get() absorbs the lock-free race where an indexed id has just been
+    # popped from the store by a concurrent delete.
+    ids = id_sets[0].intersection(*id_sets[1:])
+    data = appointments_data
+    return tuple(
+        apt for apt in map(data.get, sorted(ids)) if apt is not None
+    )
 
 
 # =============================================================================
@@ -351,19 +708,35 @@ def update_appointment_status(appointment_id, new_status):
     Returns:
         dict: Updated appointment object or None if not found
     """
-    for apt in appointments_data:
-        if apt["id"] == appointment_id:
-            # Simulating the status update (in production: Aurora write)
-            apt["status"] = new_status
+    # Simulating the status update (in production: Aurora write).
+    # Move the record between status-index buckets so _by_status stays
+    # consistent with the new value.
+    new_status = sys.intern(new_status)
+    with _write_lock:
+        # Primary-key lookup (no table scan). The lookup has to happen
+        # under the lock: resolving the id first and locking later would
+        # let a concurrent delete win the lock in between, after which
+        # this update would resurrect the dead id in _by_status and push
+        # the already-removed status counters out of balance.
+        apt = appointments_data.get(appointment_id)
+        if apt is None:
+            return None
+
+        if new_status != apt.status:
+            _by_status[apt.status] = _by_status[apt.status] - {apt.id}
+            _by_status[new_status] = _by_status[new_status] | {apt.id}
+            _dec(_count_by_date_status, (apt.date, apt.status))
+            _count_by_date_status[(apt.date, new_status)] += 1
+            apt.status = new_status
+            apt.status_code = _code(new_status, _status_codes)
+            _bump_version()
 
-            # NOTE: In production, after this point:
-            # 1. AppSync Subscription would be triggered automatically
-            # 2. All subscribed clients receive the update in real-time
-            # 3. Frontend updates immediately without polling
+    # NOTE: In production, after this point:
+    # 1. AppSync Subscription would be triggered automatically
+    # 2. All subscribed clients receive the update in real-time
+    # 3. Frontend updates immediately without polling
 
-            return apt
-    
-    return None
+    return apt
 
 
 # =============================================================================
@@ -462,51 +835,97 @@ def create_appointment(payload):
     Raises:
         ValueError: If required fields are missing or time conflict detected
     """
+    # The conflict check and the insert run under the writer lock so two
+    # concurrent creates cannot both pass the overlap test and
+    # double-book the slot (simulating the transactional write).
+    with _write_lock:
+        new_appointment = _create_appointment_locked(payload)
+        _publish_snapshot()
+        _bump_version()
+
+    # NOTE: In production, after this point:
+    # 1. AppSync Subscription (onAppointmentCreated) would be triggered
+    # 2. All subscribed clients receive the new appointment in real-time
+    # 3. Frontend updates immediately without polling
+
+    return new_appointment
+
+
+def _create_appointment_locked(payload):
+    """
+    Validate, conflict-check and insert one appointment.
+
+    The caller must hold _write_lock and is responsible for publishing a
+    new snapshot and bumping the data version afterwards; keeping those
+    out of this function lets create_appointments_bulk() amortize them
+    over a whole batch.
+    """
     global _next_id
 
     # =========================================================================
     # STEP 1: Validate required fields
     # =========================================================================
-    required_fields = ['patientName', 'date', 'time', 'duration', 'doctorName', 'mode']
-    missing_fields = [field for field in required_fields if field not in payload or not payload[field]]
-
-    if missing_fields:
-        raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+    # Absent keys fall out of a single set difference; present-but-empty
+    # values are caught by a short any() over the remaining fields.
+    missing = _REQUIRED_FIELDS - payload.keys()
+    if missing or any(not payload[f] for f in _REQUIRED_FIELDS - missing):
+        # Error path only: rebuild the field list in declaration order
+        # so the message reads the same as before
+        bad = [f for f in _REQUIRED_FIELD_ORDER
+               if f in missing or not payload.get(f)]
+        raise ValueError(f"Missing required fields: {', '.join(bad)}")
+
+    # Format and vocabulary checks: O(1) frozenset membership for the
+    # enum-like fields, precompiled patterns for date/time. Rejecting
+    # malformed values here keeps the date- and time-sorted indexes
+    # chronologically ordered.
+    if not _DATE_RE.match(payload['date']):
+        raise ValueError(f"Invalid date format: {payload['date']!r} (expected YYYY-MM-DD)")
+    if not _TIME_RE.match(payload['time']):
+        raise ValueError(f"Invalid time format: {payload['time']!r} (expected HH:MM)")
+    if payload['mode'] not in _VALID_MODES:
+        raise ValueError(
+            f"Invalid mode: {payload['mode']!r} (expected one of {', '.join(sorted(_VALID_MODES))})"
+        )
+    status = payload.get('status', 'Scheduled')
+    if status not in _VALID_STATUSES:
+        raise ValueError(
+            f"Invalid status: {status!r} (expected one of {', '.join(sorted(_VALID_STATUSES))})"
+        )
 
     # =========================================================================
     # STEP 2: Check for time conflicts (overlap detection)
     # =========================================================================
-    # Get the new appointment's time window
-    new_date = payload['date']
-    new_time = payload['time']
-    new_duration = int(payload['duration'])
-    new_doctor = payload['doctorName']
-
-    # Convert time string to minutes for easier comparison
-    def time_to_minutes(time_str):
-        """Convert HH:MM to total minutes"""
-        hours, minutes = map(int, time_str.split(':'))
-        return hours * 60 + minutes
-
-    new_start = time_to_minutes(new_time)
-    new_end = new_start + new_duration
-
-    # Check for conflicts with existing appointments for the same doctor on the same date
-    for apt in appointments_data:
-        if (apt['doctorName'] == new_doctor and
-            apt['date'] == new_date and
-            apt['status'] != 'Cancelled'):  # Don't check cancelled appointments
+    # Get the new appointment's time window (one itemgetter call instead
+    # of four separate keyed lookups)
+    new_date, new_time, new_duration, new_doctor = _CONFLICT_FIELDS(payload)
+    new_duration = int(new_duration)
 
-            existing_start = time_to_minutes(apt['time'])
-            existing_end = existing_start + apt['duration']
+    new_start = _time_to_minutes(new_time)
+    new_end = new_start + new_duration
 
-            # Check for overlap: two time ranges overlap if one starts before the other ends
-            # Overlap condition: (new_start < existing_end) AND (existing_start < new_end)
-            if new_start < existing_end and existing_start < new_end:
+    # Check for conflicts with existing appointments for the same doctor on the
+    # same date. The (doctorName, date) bucket is sorted by start time, so a
+    # binary search locates the first entry that could still overlap (anything
+    # starting earlier than new_start - longest-appointment-in-bucket must
+    # already have ended) and the scan stops at the first entry starting at or
+    # after new_end.
+    bucket_key = (new_doctor, new_date)
+    bucket = _by_doctor_date[bucket_key]
+    lo = bisect_left(bucket, (new_start - _bucket_max_duration[bucket_key],))
+    for i in range(lo, len(bucket)):
+        existing_start, existing_end, _, apt = bucket[i]
+        if existing_start >= new_end:
+            break
+        # Overlap condition: (new_start < existing_end) AND (existing_start < new_end)
+        # The status lookup (a dict access) only happens for actual overlaps;
+        # cancelled slots don't block.
+        if new_start < existing_end:
+            if apt.status_code != _CANCELLED_CODE:  # Don't check cancelled appointments
                 raise ValueError(
                     f"Time conflict detected: {new_doctor} already has an appointment "
-                    f"on {new_date} from {apt['time']} for {apt['duration']} minutes "
-                    f"(Patient: {apt['name']})"
+                    f"on {new_date} from {apt.time} for {apt.duration} minutes "
+                    f"(Patient: {apt.name})"
                 )
 
     # =========================================================================
@@ -517,36 +936,80 @@ def create_appointment(payload):
     new_id = _next_id
     _next_id += 1
 
-    # Create the new appointment object
-    new_appointment = {
-        "id": new_id,
-        "name": payload['patientName'],  # Map patientName to name for consistency
-        "date": payload['date'],
-        "time": payload['time'],
-        "duration": int(payload['duration']),
-        "doctorName": payload['doctorName'],
-        "status": payload.get('status', 'Scheduled'),  # Default to 'Scheduled' if not provided
-        "mode": payload['mode'],
-        "reason": payload.get('reason', ''),
-        "phone": payload.get('phone', ''),
-        "email": payload.get('email', ''),
-        "notes": payload.get('notes', '')
-    }
+    # Create the new appointment record
+    new_appointment = Appointment(
+        id=new_id,
+        name=payload['patientName'],  # Map patientName to name for consistency
+        date=payload['date'],
+        time=payload['time'],
+        duration=new_duration,  # Already converted during conflict detection
+        doctorName=payload['doctorName'],
+        status=payload.get('status', 'Scheduled'),  # Default to 'Scheduled' if not provided
+        mode=payload['mode'],
+        reason=payload.get('reason', ''),
+        phone=payload.get('phone', ''),
+        email=payload.get('email', ''),
+        notes=payload.get('notes', ''),
+    )
 
     # =========================================================================
     # STEP 4: Insert into mock database
     # =========================================================================
     # In production: Aurora transactional write
-    appointments_data.append(new_appointment)
-
-    # NOTE: In production, after this point:
-    # 1. AppSync Subscription (onAppointmentCreated) would be triggered
-    # 2. All subscribed clients receive the new appointment in real-time
-    # 3. Frontend updates immediately without polling
+    appointments_data[new_id] = new_appointment
+    _index_appointment(new_appointment)
 
     return new_appointment
 
 
+# =============================================================================
+# BULK CREATE FUNCTION: create_appointments_bulk(payloads)
+# =============================================================================
+def create_appointments_bulk(payloads):
+    """
+    Create many appointments in one transaction-like batch.
+
+    Each payload is validated and conflict-checked exactly like
+    create_appointment(), but the writer lock is taken once, the reader
+    snapshot is rebuilt once, and the data version is bumped once for the
+    whole batch instead of per item. A payload that fails for any reason
+    - validation, a conflict (including with an earlier payload in the
+    same batch), or a malformed item such as a non-dict entry or a
+    non-numeric duration - is reported in `errors` and does not abort
+    the rest of the batch.
+
+    Args:
+        payloads (list): List of payload dicts (see create_appointment)
+
+    Returns:
+        tuple: (created, errors) where created is a list of Appointment
+               records and errors is a list of {"index": int, "error": str}
+               dicts referring back to positions in `payloads`
+    """
+    created = []
+    errors = []
+    with _write_lock:
+        try:
+            for index, payload in enumerate(payloads):
+                try:
+                    created.append(_create_appointment_locked(payload))
+                except Exception as exc:
+                    # Broad on purpose: a non-dict item or a non-numeric
+                    # duration raises AttributeError/TypeError rather than
+                    # ValueError, and any single bad item must land in
+                    # `errors` instead of aborting the batch.
+                    errors.append({"index": index, "error": str(exc)})
+        finally:
+            # Publish inside finally so rows inserted before an
+            # unexpected failure (e.g. a non-iterable `payloads`
+            # mid-loop) are never left visible in the store and indexes
+            # but missing from the snapshot and version.
+            if created:
+                _publish_snapshot()
+                _bump_version()
+    return created, errors
+
+
 # =============================================================================
 # DELETE FUNCTION: delete_appointment(id)
 # =============================================================================
@@ -611,23 +1074,24 @@ def delete_appointment(appointment_id):
     Returns:
         bool: True if deletion was successful, False if appointment not found
     """
-    global appointments_data
-
-    # Find the appointment index
-    for i, apt in enumerate(appointments_data):
-        if apt["id"] == appointment_id:
-            # Remove the appointment from the list
-            # In production: This would be a transactional DELETE or soft-delete UPDATE
-            appointments_data.pop(i)
+    # Primary-key dict pop: O(1), no table scan and no element shifting
+    # In production: This would be a transactional DELETE or soft-delete UPDATE
+    with _write_lock:
+        apt = appointments_data.pop(appointment_id, None)
+        if apt is None:
+            return False
+
+        # Remove the appointment from every secondary index
+        _unindex_appointment(apt)
+        _publish_snapshot()
+        _bump_version()
 
-            # NOTE: In production, after this point:
-            # 1. AppSync Subscription (onAppointmentDeleted) would be triggered
-            # 2. All subscribed clients receive notification to remove the appointment
-            # 3. Frontend removes the item immediately without polling
-
-            return True
+    # NOTE: In production, after this point:
+    # 1. AppSync Subscription (onAppointmentDeleted) would be triggered
+    # 2. All subscribed clients receive notification to remove the appointment
+    # 3. Frontend removes the item immediately without polling
 
-    return False
+    return True
 
 
 # =============================================================================
@@ -761,6 +1225,24 @@ These mechanisms work together to ensure:
 # =============================================================================
 # HELPER FUNCTION: get_appointments_by_period
 # =============================================================================
+# Cache for today's ISO date string: [epoch of next local midnight,
+# "YYYY-MM-DD"]. The fast path is one time.time() call and a float
+# compare - no datetime object is built per call; the date is only
+# re-derived when the clock actually crosses local midnight.
+_today_cache = [0.0, ""]
+
+
+def _today():
+    """Return today's date as an ISO "YYYY-MM-DD" string, cached per day."""
+    if time.time() >= _today_cache[0]:
+        now = datetime.now()
+        midnight = (now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        _today_cache[:] = [midnight.timestamp(), now.date().isoformat()]
+    return _today_cache[1]
+
+
 def get_appointments_by_period(period):
     """
     Get appointments based on time period relative to today.
@@ -772,18 +1254,100 @@ def get_appointments_by_period(period):
         period (str): One of 'today', 'upcoming', 'past', or 'all'
 
     Returns:
-        list: Filtered list of appointments
+        list: Filtered list of appointments, ordered by date then id
     """
-    today = datetime.now().strftime("%Y-%m-%d")
-    
+    today = _today()
+
+    # Bisect the sorted (date, id) index to the boundaries around today
+    # and slice: only the rows actually returned are touched, instead of
+    # a date comparison per appointment. Every entry with today's date
+    # sorts between (today,) and (today, inf) - ids are ints, so the
+    # float infinity sentinel sorts after all of them.
+    # Capture local references once: a concurrent writer may rebind the
+    # module globals, but this call keeps working against one coherent
+    # view. The .get() filter absorbs an id whose row a concurrent delete
+    # has just popped from the store.
+    index = _dates_sorted
+    data = appointments_data
     if period == "today":
-        return [apt for apt in appointments_data if apt["date"] == today]
+        lo = bisect_left(index, (today,))
+        hi = bisect_left(index, (today, float("inf")))
     elif period == "upcoming":
-        return [apt for apt in appointments_data if apt["date"] > today]
+        lo = bisect_left(index, (today, float("inf")))
+        hi = len(index)
     elif period == "past":
-        return [apt for apt in appointments_data if apt["date"] < today]
+        lo = 0
+        hi = bisect_left(index, (today,))
     else:
-        return appointments_data.copy()
+        return list(_snapshot)
+
+    return [apt for _, apt_id in index[lo:hi]
+            if (apt := data.get(apt_id)) is not None]
+
+
+# =============================================================================
+# HELPER FUNCTION: get_data_version
+# =============================================================================
+def get_data_version():
+    """
+    Return the current data version.
+
+    The version is a monotonically increasing integer bumped by every
+    mutation, so callers (e.g. the HTTP layer) can cache anything derived
+    from the appointment data and invalidate it with a single int compare.
+
+    Returns:
+        int: The current version number
+    """
+    return _version
+
+
+# =============================================================================
+# HELPER FUNCTION: get_doctors
+# =============================================================================
+def get_doctors():
+    """
+    Return the sorted list of distinct doctor names.
+
+    The list is maintained incrementally by the mutation paths (rebuilt
+    only when a doctor first appears or last disappears), so this is a
+    constant-time read. Callers should treat the result as read-only.
+
+    Returns:
+        list: Doctor names in alphabetical order
+    """
+    return _sorted_doctors
+
+
+# =============================================================================
+# HELPER FUNCTION: get_stats
+# =============================================================================
+def get_stats():
+    """
+    Return the dashboard statistics as a dict.
+
+    All six figures come straight from the incrementally maintained
+    counters, so this is a handful of dict lookups regardless of how many
+    appointments exist. upcomingCount is a bisect into the sorted
+    (date, id) index: everything after the (today, inf) split point is in
+    the future. Deliberately no dict iteration here - single lookups and
+    an atomic list slice stay safe against concurrent writers, where an
+    items() loop would not.
+
+    Returns:
+        dict: totalPatients, appointmentsToday, confirmedToday,
+              upcomingCount, videoCallsToday, totalDoctors
+    """
+    today = _today()
+    index = _dates_sorted
+    return {
+        "totalPatients": len(_patient_counts),
+        "appointmentsToday": _count_by_date.get(today, 0),
+        "confirmedToday": _count_by_date_status.get((today, "Confirmed"), 0),
+        "upcomingCount": len(index) - bisect_left(index, (today, float("inf"))),
+        "videoCallsToday": _count_by_date_mode.get((today, "Video Call"), 0),
+        "totalDoctors": len(_doctor_counts),
+    }
 
 
 # =============================================================================
@@ -793,7 +1357,12 @@ def get_appointments_json(date=None, status=None):
     """
     Returns appointments as a JSON string for frontend consumption.
     """
-    return json.dumps(get_appointments(date, status))
+    result = [apt.to_dict() for apt in get_appointments(date, status)]
+    if orjson is not None:
+        return orjson.dumps(result).decode()
+    # Compact separators and ensure_ascii=False keep the stdlib encoder from
+    # emitting padding and escaping non-ASCII characters it doesn't need to.
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False)
 
 
 # =============================================================================
@@ -812,31 +1381,31 @@ if __name__ == "__main__":
     all_apts = get_appointments()
     print(f"   Total count: {len(all_apts)}")
     for apt in all_apts[:3]:
-        print(f"   - {apt['name']} on {apt['date']} at {apt['time']} ({apt['status']})")
+        print(f"   - {apt.name} on {apt.date} at {apt.time} ({apt.status})")
     print("   ...")
 
     print("\n2. Today's appointments (2026-01-30):")
     today_apts = get_appointments(date="2026-01-30")
     print(f"   Count: {len(today_apts)}")
     for apt in today_apts:
-        print(f"   - {apt['name']} at {apt['time']} with {apt['doctorName']}")
+        print(f"   - {apt.name} at {apt.time} with {apt.doctorName}")
 
     print("\n3. Confirmed appointments:")
     confirmed_apts = get_appointments(status="Confirmed")
     print(f"   Count: {len(confirmed_apts)}")
     for apt in confirmed_apts[:3]:
-        print(f"   - {apt['name']} on {apt['date']} ({apt['mode']})")
+        print(f"   - {apt.name} on {apt.date} ({apt.mode})")
 
     print("\n4. Filter by doctor (Dr. Rajesh Kumar):")
     doctor_apts = get_appointments(doctorName="Dr. Rajesh Kumar")
     print(f"   Count: {len(doctor_apts)}")
     for apt in doctor_apts:
-        print(f"   - {apt['name']} on {apt['date']} at {apt['time']}")
+        print(f"   - {apt.name} on {apt.date} at {apt.time}")
 
     print("\n5. Testing status update:")
-    print("   Before: Appointment 1 status =", appointments_data[0]['status'])
+    print("   Before: Appointment 1 status =", appointments_data[1].status)
     update_appointment_status(1, "Cancelled")
-    print("   After:  Appointment 1 status =", appointments_data[0]['status'])
+    print("   After:  Appointment 1 status =", appointments_data[1].status)
     # Restore original status
     update_appointment_status(1, "Confirmed")
 
@@ -853,8 +1422,8 @@ if __name__ == "__main__":
             "phone": "+91 98765 99999",
             "email": "test@email.com"
         })
-        print(f"   Created: ID={new_apt['id']}, {new_apt['name']} on {new_apt['date']} at {new_apt['time']}")
-        print(f"   Status: {new_apt['status']} (default)")
+        print(f"   Created: ID={new_apt.id}, {new_apt.name} on {new_apt.date} at {new_apt.time}")
+        print(f"   Status: {new_apt.status} (default)")
     except ValueError as e:
         print(f"   Error: {e}")
 
@@ -887,7 +1456,7 @@ if __name__ == "__main__":
     initial_count = len(appointments_data)
     print(f"   Before deletion: {initial_count} appointments")
     if new_apt:
-        result = delete_appointment(new_apt['id'])  # Delete the test appointment we created
+        result = delete_appointment(new_apt.id)  # Delete the test appointment we created
         print(f"   Delete result: {result}")
         print(f"   After deletion: {len(appointments_data)} appointments")
     else:
@@ -7,10 +7,18 @@ Run: python backend/app.py
 Server: http://localhost:5000
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
+import json
 import sys
 import os
+import time
+from datetime import date
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 # Add parent directory to import appointment_service
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,15 +26,54 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from appointment_service import (
     get_appointments,
     create_appointment,
+    create_appointments_bulk,
     update_appointment_status,
     delete_appointment,
-    appointments_data
+    get_data_version,
+    get_doctors,
+    get_stats
 )
 
 app = Flask(__name__)
 CORS(app)
 
 
+# =============================================================================
+# RESPONSE ENCODING - orjson with cached bodies for the hot GET endpoints
+# =============================================================================
+# Encoding the response body dominates the cost of the read endpoints once
+# the service-layer lookups are O(1). orjson encodes dict/list payloads
+# several times faster than stdlib json, and since the payloads only change
+# when the data does, the encoded bytes are cached per endpoint keyed on a
+# freshness token (the service's data version, plus today's date where the
+# payload depends on it). A repeat GET between mutations is a dict lookup
+# and a Response construction - no serialization at all.
+
+_body_cache = {}
+
+# Captured once at import: the data version restarts at 0 with every
+# process, so an ETag must also name *which* process issued it or a
+# client could get a false 304 from a restarted server that happens to
+# have reached the same version number with different data.
+_BOOT_TOKEN = time.time_ns()
+
+
+def _dumps(payload):
+    """Encode a payload to JSON bytes with orjson, or stdlib json if absent."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def _json_response(cache_key, token, builder):
+    """Serve a cached JSON body for cache_key, rebuilding when token changes."""
+    cached = _body_cache.get(cache_key)
+    if cached is None or cached[0] != token:
+        cached = (token, _dumps(builder()))
+        _body_cache[cache_key] = cached
+    return Response(cached[1], mimetype='application/json')
+
+
 @app.route('/api/appointments', methods=['GET'])
 def api_get_appointments():
     """GET /api/appointments - Get all appointments with optional filters"""
@@ -34,9 +81,31 @@ def api_get_appointments():
     status = request.args.get('status')
     doctor_name = request.args.get('doctorName')
 
-    appointments = get_appointments(date=date, status=status, doctorName=doctor_name)
-
-    return jsonify({'success': True, 'data': appointments, 'count': len(appointments)})
+    # Weak ETag from the boot token, the data version and the filter
+    # combination: the payload for a given filter set can only change
+    # when a mutation bumps the version, and the boot token keeps ETags
+    # minted by a previous process from matching after a restart. A
+    # matching If-None-Match skips body encoding and transfer entirely.
+    # (hash() is stable within a process, which is all an ETag needs.)
+    etag = f'W/"{_BOOT_TOKEN}-{get_data_version()}-{hash((date, status, doctor_name))}"'
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304)
+
+    def build():
+        appointments = [apt.to_dict() for apt in
+                        get_appointments(date=date, status=status,
+                                         doctorName=doctor_name)]
+        return {'success': True, 'data': appointments,
+                'count': len(appointments)}
+
+    if date is None and status is None and doctor_name is None:
+        # The unfiltered listing is the hottest endpoint - serve the
+        # cached body until a mutation bumps the data version.
+        resp = _json_response('appointments', get_data_version(), build)
+    else:
+        resp = Response(_dumps(build()), mimetype='application/json')
+    resp.headers['ETag'] = etag
+    return resp
 
 
 @app.route('/api/appointments', methods=['POST'])
@@ -48,7 +117,7 @@ def api_create_appointment():
             return jsonify({'success': False, 'error': 'Request body required'}), 400
 
         new_appointment = create_appointment(payload)
-        return jsonify({'success': True, 'data': new_appointment}), 201
+        return jsonify({'success': True, 'data': new_appointment.to_dict()}), 201
 
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
@@ -56,6 +125,30 @@ def api_create_appointment():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/appointments/bulk', methods=['POST'])
+def api_create_appointments_bulk():
+    """POST /api/appointments/bulk - Create many appointments in one request
+
+    Accepts a JSON list of payloads and amortizes routing, JSON parsing
+    and lock/snapshot overhead over the whole batch. Items that fail
+    validation or conflict are reported per index; the rest are created.
+    """
+    try:
+        payloads = request.get_json()
+        if not isinstance(payloads, list) or not payloads:
+            return jsonify({'success': False,
+                            'error': 'Request body must be a non-empty list'}), 400
+
+        created, errors = create_appointments_bulk(payloads)
+        status = 201 if created else 400
+        return jsonify({'success': not errors,
+                        'created': [apt.to_dict() for apt in created],
+                        'errors': errors}), status
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/appointments/<int:appointment_id>', methods=['PUT'])
 def api_update_appointment(appointment_id):
     """PUT /api/appointments/<id> - Update appointment status"""
@@ -66,7 +159,7 @@ def api_update_appointment(appointment_id):
 
         updated = update_appointment_status(appointment_id, payload['status'])
         if updated:
-            return jsonify({'success': True, 'data': updated})
+            return jsonify({'success': True, 'data': updated.to_dict()})
         return jsonify({'success': False, 'error': 'Not found'}), 404
 
     except Exception as e:
@@ -88,28 +181,22 @@ def api_delete_appointment(appointment_id):
 @app.route('/api/doctors', methods=['GET'])
 def api_get_doctors():
     """GET /api/doctors - Get unique list of doctors"""
-    doctors = list(set(apt['doctorName'] for apt in appointments_data))
-    return jsonify({'success': True, 'data': sorted(doctors)})
+    # The service layer keeps this list sorted and up to date, so the
+    # per-request set build + sort is gone.
+    return _json_response('doctors', get_data_version(),
+                          lambda: {'success': True, 'data': get_doctors()})
 
 
 @app.route('/api/stats', methods=['GET'])
 def api_get_stats():
     """GET /api/stats - Get dashboard statistics"""
-    from datetime import datetime
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    all_apts = appointments_data
-    today_apts = [a for a in all_apts if a['date'] == today]
-
-    stats = {
-        'totalPatients': len(set(a['name'] for a in all_apts)),
-        'appointmentsToday': len(today_apts),
-        'confirmedToday': len([a for a in today_apts if a['status'] == 'Confirmed']),
-        'upcomingCount': len([a for a in all_apts if a['date'] > today]),
-        'videoCallsToday': len([a for a in today_apts if a['mode'] == 'Video Call']),
-        'totalDoctors': len(set(a['doctorName'] for a in all_apts))
-    }
-    return jsonify({'success': True, 'data': stats})
+    # The service layer maintains these aggregates incrementally on every
+    # mutation, so this endpoint no longer scans the appointment table.
+    # The stats also depend on the calendar day, so today's date is part
+    # of the freshness token.
+    token = (get_data_version(), date.today().isoformat())
+    return _json_response('stats', token,
+                          lambda: {'success': True, 'data': get_stats()})
 
 
 @app.route('/api/health', methods=['GET'])
@@ -131,5 +218,14 @@ if __name__ == '__main__':
     print("\nStarting on http://localhost:5000")
     print("="*60 + "\n")
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Werkzeug's dev server handles one request at a time and debug mode
+    # adds reloader/debugger overhead per request. waitress is a
+    # production WSGI server; a thread pool is the right shape here since
+    # every handler is a short burst of pure-Python dict work.
+    try:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8)
+    except ImportError:
+        print("waitress not installed - falling back to the Flask dev server\n")
+        app.run(debug=True, host='0.0.0.0', port=5000)
 